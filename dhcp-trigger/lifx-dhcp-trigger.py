@@ -11,6 +11,7 @@ from typing import Dict, Union
 import click
 import yaml
 
+from lifxdev.config import loader
 from lifxdev.messages import packet
 from lifxdev.server import client
 from lifxdev.server import server
@@ -58,7 +59,7 @@ class DhcpTrigger:
             raise FileNotFoundError(config_path)
 
         with config_path.open() as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=loader.SafeLoader)
 
         # Dictionary containing all MAC addresses and their command-type
         self._all_macs: Dict[str, str] = {}
@@ -3,22 +3,35 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 import random
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 import numpy as np
-from matplotlib import colormaps
-from matplotlib import colors
 
 from lifxdev.messages import packet
 
+# Matplotlib is slow to import, so it is only loaded once a colormap is needed.
+if TYPE_CHECKING:
+    from matplotlib import colors
+
 KELVIN = 5500
 
+# Register limits of a LIFX HSBK packet. The hue register wraps around at 360 degrees.
+_MAX_HUE = packet.Hsbk().get_max("hue") + 1
+_MAX_SATURATION = packet.Hsbk().get_max("saturation")
+_MAX_BRIGHTNESS = packet.Hsbk().get_max("brightness")
+_HUE_TO_DEGREES = 360 / _MAX_HUE
+_DEGREES_TO_HUE = _MAX_HUE / 360
+
 
 @dataclasses.dataclass
 class Hsbk:
     """Human-readable HSBK tuple"""
 
+    # Colormaps create an Hsbk per zone or pixel, so skip the per-instance __dict__
+    __slots__ = ("hue", "saturation", "brightness", "kelvin")
+
     hue: float
     saturation: float
     brightness: float
@@ -27,13 +40,9 @@ class Hsbk:
     @classmethod
     def from_packet(cls, hsbk: packet.Hsbk) -> "Hsbk":
         """Create a HSBK tuple from a message packet"""
-        max_hue = hsbk.get_max("hue") + 1
-        max_saturation = hsbk.get_max("saturation")
-        max_brightness = hsbk.get_max("brightness")
-
-        hue = 360 * hsbk["hue"] / max_hue
-        saturation = hsbk["saturation"] / max_saturation
-        brightness = hsbk["brightness"] / max_brightness
+        hue = hsbk["hue"] * _HUE_TO_DEGREES
+        saturation = hsbk["saturation"] / _MAX_SATURATION
+        brightness = hsbk["brightness"] / _MAX_BRIGHTNESS
         kelvin = hsbk["kelvin"]
 
         return cls(hue=hue, saturation=saturation, brightness=brightness, kelvin=kelvin)
@@ -55,17 +64,35 @@ class Hsbk:
     def to_packet(self) -> packet.Hsbk:
         """Create a message packet from an HSBK tuple"""
         hsbk = packet.Hsbk()
-        max_hue = hsbk.get_max("hue") + 1
-        max_saturation = hsbk.get_max("saturation")
-        max_brightness = hsbk.get_max("brightness")
-
-        hsbk["hue"] = int(self.hue * max_hue / 360) % max_hue
-        hsbk["saturation"] = min(int(self.saturation * max_saturation), max_saturation)
-        hsbk["brightness"] = min(int(self.brightness * max_brightness), max_brightness)
+        hsbk["hue"] = int(self.hue * _DEGREES_TO_HUE) % _MAX_HUE
+        hsbk["saturation"] = min(int(self.saturation * _MAX_SATURATION), _MAX_SATURATION)
+        hsbk["brightness"] = min(int(self.brightness * _MAX_BRIGHTNESS), _MAX_BRIGHTNESS)
         hsbk["kelvin"] = int(self.kelvin)
         return hsbk
 
 
+def _get_hsv_lut(mpl_cmap: colors.Colormap) -> np.ndarray:
+    """Get the HSV value of every entry in a colormap's lookup table.
+
+    Returns:
+        A read-only (N, 3) array of hue (degrees), saturation, and brightness.
+    """
+    from matplotlib import colors
+
+    hsv_lut = colors.rgb_to_hsv(mpl_cmap(np.arange(mpl_cmap.N))[:, :3])
+    hsv_lut[:, 0] *= 360
+    hsv_lut.flags.writeable = False
+    return hsv_lut
+
+
+@functools.lru_cache(maxsize=32)
+def _get_named_hsv_lut(cmap_name: str) -> np.ndarray:
+    """Get the HSV lookup table of a registered colormap, computed once per name."""
+    from matplotlib import colormaps
+
+    return _get_hsv_lut(colormaps.get_cmap(cmap_name))
+
+
 def get_colormap(
     cmap: str | colors.Colormap,
     length: int,
@@ -84,25 +111,33 @@ def get_colormap(
     Returns:
         A list of HSBK values for the colormap.
     """
-    mpl_cmap = colormaps.get_cmap(cmap) if isinstance(cmap, str) else cmap
+    hsv_lut = _get_named_hsv_lut(cmap) if isinstance(cmap, str) else _get_hsv_lut(cmap)
 
     if length < 1:
         raise ValueError("length must be at least one.")
-    elif length == 1:
-        selectors = [random.random() if randomize else 0.0]
-    else:
-        selectors = [ii / (length - 1) for ii in range(length)]
+
+    # Evenly spaced colormap positions. Randomizing wraps them around a random offset.
+    # Divide like ii / (length - 1): linspace rounds differently and can pick the neighboring color.
+    selectors = np.arange(length) / max(length - 1, 1)
     if randomize:
-        offset = random.random()
-        selectors = [(idx + offset) % 1.0 for idx in selectors]
-        random.shuffle(selectors)
+        np.mod(selectors + random.random(), 1.0, out=selectors)
+
+    # Index the lookup table the same way matplotlib does for floats in [0, 1]
+    num_entries = len(hsv_lut)
+    indices = np.minimum((selectors * num_entries).astype(int), num_entries - 1)
+    hsbk_list = [
+        Hsbk(hue=hue, saturation=saturation, brightness=brightness, kelvin=kelvin)
+        for hue, saturation, brightness in hsv_lut[indices].tolist()
+    ]
 
-    rgb_array = np.array(colors.to_rgba_array(mpl_cmap(selectors))).transpose()[:3].transpose()
-    hsv_array = colors.rgb_to_hsv(rgb_array)
-    hsbk_list = [Hsbk.from_tuple((360 * hsv[0],) + tuple(hsv[1:]) + (kelvin,)) for hsv in hsv_array]
+    # Shuffling a list swaps references, where shuffling an array boxes every element
+    if randomize:
+        random.shuffle(hsbk_list)
     return hsbk_list
 
 
 def get_all_colormaps() -> list[str]:
     """Get a list of all colormaps"""
+    from matplotlib import colormaps
+
     return sorted(colormaps.keys())
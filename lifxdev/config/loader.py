@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+"""Load YAML config files shared by the device and process managers"""
+
+from __future__ import annotations
+
+import pathlib
+from typing import Any
+
+import yaml
+
+# The libyaml loader is much faster, but PyYAML can be built without it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Parsed configs keyed by path, stored with the (mtime, size) they were parsed at
+_config_cache: dict[pathlib.Path, tuple[tuple[int, int], Any]] = {}
+
+
+def load_yaml(config_path: str | pathlib.Path) -> Any:
+    """Load a YAML config, only parsing it again if the file has changed.
+
+    The returned object is shared with the cache and must not be modified.
+
+    Args:
+        config_path: (str) Path to the YAML config.
+    """
+    config_path = pathlib.Path(config_path)
+    stat = config_path.stat()
+    file_key = (stat.st_mtime_ns, stat.st_size)
+    cached = _config_cache.get(config_path)
+    if cached and cached[0] == file_key:
+        return cached[1]
+
+    with config_path.open() as f:
+        config = yaml.load(f, Loader=SafeLoader)
+    _config_cache[config_path] = (file_key, config)
+    return config
@@ -14,6 +14,7 @@ from typing import Any
 import yaml
 
 from lifxdev.colors import color
+from lifxdev.config import loader
 from lifxdev.devices import device
 from lifxdev.devices import light
 from lifxdev.devices import multizone
@@ -23,6 +24,7 @@ from lifxdev.messages import device_messages
 
 
 CONFIG_PATH = pathlib.Path.home() / ".lifx" / "devices.yaml"
+PRODUCTS_PATH = pathlib.Path(__file__).parent / "products.yaml"
 
 
 class DeviceConfigError(Exception):
@@ -33,6 +35,14 @@ class DeviceDiscoveryError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=None)
+def _load_products() -> dict[int, dict[str, Any]]:
+    """Load product identification keyed by product ID. The YAML is only parsed once."""
+    with PRODUCTS_PATH.open() as f:
+        product_list = yaml.load(f, Loader=loader.SafeLoader).pop().get("products", [])
+    return {product["pid"]: product for product in product_list}
+
+
 @dataclasses.dataclass
 class ProductInfo:
     ip: str
@@ -72,6 +82,11 @@ class DeviceGroup:
             device_type = DeviceType[_DEVICE_TYPES_R[type(lifx_device).__name__]]
             self._devices_by_type[device_type].append(lifx_device)
 
+        # Plain and infrared bulbs share one colormap, so partition them once up front
+        self._bulbs: list[light.LifxLight] = (
+            self._devices_by_type[DeviceType.light] + self._devices_by_type[DeviceType.infrared]
+        )
+
     def get_all_devices(self) -> dict[str, Any]:
         return self._all_devices
 
@@ -97,7 +112,8 @@ class DeviceGroup:
             hsbk: (color.Hsbk) Human-readable HSBK tuple.
             duration: (float) The time in seconds to make the color transition.
         """
-
+        # Convert once so every device receives the same validated HSBK
+        hsbk = color.Hsbk.from_tuple(hsbk)
         for target in self._all_devices.values():
             target.set_color(hsbk, duration=duration, ack_required=False)
 
@@ -127,8 +143,7 @@ class DeviceGroup:
             kelvin: Color temperature of white colors in the colormap.
             division: How much to subdivide the tiles (must be in [1, 2, 4]).
         """
-        bulbs = self._devices_by_type[DeviceType.light]
-        bulbs += self._devices_by_type[DeviceType.infrared]
+        bulbs = self._bulbs
         if bulbs:
             bulb_cmap = color.get_colormap(cmap, len(bulbs), kelvin, randomize=True)
             for bulb, cmap_color in zip(bulbs, bulb_cmap):
@@ -221,15 +236,8 @@ class DeviceManager(device.LifxDevice):
         self._timeout = timeout
         self._comm_init = comm_init
 
-        # Load product identification
-        products = pathlib.Path(__file__).parent / "products.yaml"
-        with products.open() as f:
-            product_list = yaml.safe_load(f).pop().get("products", [])
-
         # For easily recovering product info via get_product_class
-        self._products: dict[str, Any] = {}
-        for product in product_list:
-            self._products[product["pid"]] = product
+        self._products = _load_products()
 
         # Load config sets the self._root_device_group variable
         self._discovered_device_group: DeviceGroup | None = None
@@ -374,8 +382,8 @@ class DeviceManager(device.LifxDevice):
         else:
             klass = light.LifxLight
 
-        product["class"] = klass
-        return product
+        # The product table is shared between device managers, so return a copy
+        return {**product, "class": klass}
 
     def load_config(self, config_path: str | pathlib.Path | None = None) -> None:
         """Load a config and populate device groups.
@@ -384,9 +392,7 @@ class DeviceManager(device.LifxDevice):
             config_path: (str) Path to the device config.
         """
         config_path = pathlib.Path(config_path or self._config_path)
-        with config_path.open() as f:
-            config_dict = yaml.safe_load(f)
-
+        config_dict = loader.load_yaml(config_path)
         self._root_device_group = self._load_device_group(config_dict)
 
     def _load_device_group(
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from matplotlib import colors
+from typing import TYPE_CHECKING
 
 from lifxdev.colors import color
 from lifxdev.devices import light
 from lifxdev.messages import multizone_messages
 from lifxdev.messages import packet
 
+if TYPE_CHECKING:
+    from matplotlib import colors
+
 
 class LifxMultiZone(light.LifxLight):
     """MultiZone device (beam, strip) control"""
@@ -74,14 +77,22 @@ class LifxMultiZone(light.LifxLight):
             ack_required: (bool) True gets an acknowledgement from the device.
         """
         set_colors = multizone_messages.SetExtendedColorZones()
+        max_zones = set_colors.get_array_size("colors")
+        if index + len(multizone_colors) > max_zones:
+            raise IndexError(
+                f"Cannot set {len(multizone_colors)} zones from index {index}: "
+                f"a message holds at most {max_zones} colors."
+            )
+
         set_colors["apply"] = multizone_messages.ApplicationRequest.APPLY
         set_colors["duration"] = int(duration * 1000)
         set_colors["index"] = index
         set_colors["colors_count"] = len(multizone_colors)
-        for ii, hsbk in enumerate(multizone_colors):
-            set_colors.set_value(
-                "colors",
-                color.Hsbk.from_tuple(hsbk).max_brightness(self.max_brightness).to_packet(),
-                index + ii,
-            )
+        # Fill every zone in one assignment instead of validating the register once per zone
+        zone_colors = list(set_colors["colors"])
+        zone_colors[index : index + len(multizone_colors)] = [
+            hsbk_tuple.max_brightness(self.max_brightness).to_packet()
+            for hsbk_tuple in map(color.Hsbk.from_tuple, multizone_colors)
+        ]
+        set_colors["colors"] = zone_colors
         return self.send_msg(set_colors, ack_required=ack_required)
@@ -2,16 +2,37 @@
 
 from __future__ import annotations
 
-from matplotlib import colors
+import functools
+from typing import TYPE_CHECKING
 
 from lifxdev.colors import color
 from lifxdev.devices import light
 from lifxdev.messages import tile_messages
 from lifxdev.messages import packet
 
+if TYPE_CHECKING:
+    from matplotlib import colors
+
 TILE_WIDTH = 8
 
 
+@functools.lru_cache(maxsize=None)
+def _get_square_indices(division: int) -> tuple[int, ...]:
+    """Get the index of the square each tile pixel belongs to.
+
+    Args:
+        division: How much to subdivide the tiles.
+
+    Returns:
+        For every pixel in row-major order, the row-major index of its square.
+    """
+    sq_width = TILE_WIDTH // division
+    return tuple(
+        (pixel // TILE_WIDTH // sq_width) * division + (pixel % TILE_WIDTH) // sq_width
+        for pixel in range(TILE_WIDTH**2)
+    )
+
+
 class LifxTile(light.LifxLight):
     """Tile device control"""
 
@@ -75,26 +96,15 @@ class LifxTile(light.LifxLight):
         if division not in [1, 2, 4]:
             raise ValueError("Cannot evenly subdivide tiles.")
         num_tiles = self.get_num_tiles()
-        sq_width = TILE_WIDTH // division
         sq_per_tile = division**2
         colormap = color.get_colormap(cmap, num_tiles * sq_per_tile, kelvin, randomize=True)
 
-        # This is hard to not be some gnarly for loop
+        # Each tile gets its own run of colors, one per square, spread over the square's pixels
+        square_indices = _get_square_indices(division)
         response: packet.LifxResponse | None = None
         for ii in range(num_tiles):
-            colors_per_tile = [
-                color.Hsbk(hue=0, saturation=0, brightness=0, kelvin=0)
-            ] * TILE_WIDTH**2
-            for jj in range(sq_per_tile):
-                col = jj % division
-                row = jj // division
-                for kk in range(sq_width**2):
-                    sq_col = kk % sq_width
-                    sq_row = kk // sq_width
-                    tile_idx = sq_col + col * sq_width + TILE_WIDTH * (sq_row + row * sq_width)
-                    color_idx = ii * sq_per_tile + row * division + col
-                    colors_per_tile[tile_idx] = colormap[color_idx]
-
+            tile_squares = colormap[ii * sq_per_tile : (ii + 1) * sq_per_tile]
+            colors_per_tile = [tile_squares[sq_idx] for sq_idx in square_indices]
             response = self.set_tile_colors(
                 ii,
                 colors_per_tile,
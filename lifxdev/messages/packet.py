@@ -7,7 +7,6 @@ import dataclasses
 import enum
 import logging
 import os
-import re
 import selectors
 import socket
 import struct
@@ -225,7 +224,7 @@ class LifxStruct:
         if name not in self._names:
             raise KeyError(f"{name!r} not a valid register name")
 
-        register_type = self.get_type(name)
+        register_type = self._types[name]
         value = self._values[name]
         if register_type.value[1] == "c":
             value = bytes(value).decode()
@@ -238,16 +237,20 @@ class LifxStruct:
         return value
 
     def _check_value(self, value: Any, name: str) -> Any:
-        """Validate integer values are within bounds"""
+        """Validate integer values are within bounds.
+
+        Lists and tuples are checked element-wise against bounds looked up once.
+        """
         # Only integer/floating values can be checked.
-        register_type = self.get_type(name)
+        register_type = self._types[name]
         if not register_type.value[1] or register_type.value[1] == "c":
             return value
 
         min_value = self.get_min(name)
         max_value = self.get_max(name)
-        if value < min_value or value > max_value:
-            raise ValueError(f"value {value} out of bounds for register {name!r}")
+        for vv in value if isinstance(value, (list, tuple)) else (value,):
+            if vv < min_value or vv > max_value:
+                raise ValueError(f"value {vv} out of bounds for register {name!r}")
         return value
 
     def __setitem__(self, name: str, value: Any) -> None:
@@ -305,7 +308,7 @@ class LifxStruct:
         if isinstance(value, (bytes, str)):
             self._values[name] = value
         elif isinstance(value, (list, tuple)):
-            self._values[name] = [self._check_value(vv, name) for vv in value]
+            self._values[name] = list(self._check_value(value, name))
         else:
             self._values[name][idx] = self._check_value(value, name)
 
@@ -320,7 +323,8 @@ class LifxStruct:
         assert len(self._sizes) == len(self._values)
         assert len(self._lens) == len(self._values)
 
-        message_bytes = b""
+        # Collect the pieces and join once to avoid quadratic bytes concatenation
+        message_parts: list[bytes] = []
         for reg_info in self.registers:
             rname, rtype, rlen = reg_info
 
@@ -328,19 +332,19 @@ class LifxStruct:
             if isinstance(rtype, LifxType):
                 if rtype.value[1] is None:
                     raise RuntimeError(f"Register {rname} cannot be represented as bytes.")
-                fmt = "<" + rtype.value[1] * rlen
                 values = self._values[rname]
-                # Convert bytes  to list for struct packing
+                # Char registers are stored as bytes of the register length already
                 if isinstance(values, bytes):
-                    values = [bytes([vv]) for vv in values]
-                message_bytes += struct.pack(fmt, *values)
+                    message_parts.append(values)
+                else:
+                    fmt = "<" + rtype.value[1] * rlen
+                    message_parts.append(struct.pack(fmt, *values))
 
             # Use the LifxStruct to_bytes when not a LifxType
             else:
-                for lstruct in self._values[rname]:
-                    message_bytes += lstruct.to_bytes()
+                message_parts.extend(lstruct.to_bytes() for lstruct in self._values[rname])
 
-        return message_bytes
+        return b"".join(message_parts)
 
 
 REGISTER_T = list[tuple[str, LifxType, int]]
@@ -438,7 +442,8 @@ class FrameAddress(LifxStruct):
     def to_bytes(self) -> bytes:
         """Override defaults because of sub-byte packing"""
 
-        target_bytes = struct.pack(self._fmt("target"), *self.get_value("target"))
+        # The target is a list of octets, so it maps directly to bytes
+        target_bytes = bytes(self.get_value("target"))
         res_1_bytes = struct.pack(self._fmt("reserved_1"), *self.get_value("reserved_1"))
         sequence_bytes = struct.pack(self._fmt("sequence"), self.get_value("sequence"))
 
@@ -467,7 +472,7 @@ class FrameAddress(LifxStruct):
         chunk_len = get_len("sequence")
         sequence_bytes = message_bytes[offset : offset + chunk_len]
 
-        frame_address["target"] = list(struct.unpack(frame_address._fmt("target"), target_bytes))
+        frame_address["target"] = list(target_bytes)
         frame_address["sequence"] = list(
             struct.unpack(frame_address._fmt("sequence"), sequence_bytes)
         )
@@ -486,6 +491,10 @@ class ProtocolHeader(LifxStruct):
     ]
 
 
+# HSBK values are packed many times per multizone or tile message, so compile the layout once
+_HSBK_STRUCT = struct.Struct("<HHHH")
+
+
 class Hsbk(LifxStruct):
     registers: REGISTER_T = [
         ("hue", LifxType.u16, 1),
@@ -494,6 +503,22 @@ class Hsbk(LifxStruct):
         ("kelvin", LifxType.u16, 1),
     ]
 
+    def to_bytes(self) -> bytes:
+        """Pack all four registers with a single precompiled struct"""
+        values = self._values
+        return _HSBK_STRUCT.pack(
+            values["hue"][0],
+            values["saturation"][0],
+            values["brightness"][0],
+            values["kelvin"][0],
+        )
+
+    @classmethod
+    def from_bytes(cls, message_bytes: bytes) -> "Hsbk":
+        """Unpack all four registers with a single precompiled struct"""
+        hue, saturation, brightness, kelvin = _HSBK_STRUCT.unpack(message_bytes)
+        return cls(hue=hue, saturation=saturation, brightness=brightness, kelvin=kelvin)
+
     def set_value(self, name: str, value: int | list[int]):
         """Kelvin must be between 2500 and 9000."""
         if isinstance(value, list):
@@ -754,10 +779,14 @@ class PacketComm:
         frame["size"] = len(frame) + len(frame_address) + len(protocol_header) + len(payload)
 
         # Generate the bytes for the packet
-        packet_bytes = frame.to_bytes()
-        packet_bytes += frame_address.to_bytes()
-        packet_bytes += protocol_header.to_bytes()
-        packet_bytes += payload.to_bytes()
+        packet_bytes = b"".join(
+            [
+                frame.to_bytes(),
+                frame_address.to_bytes(),
+                protocol_header.to_bytes(),
+                payload.to_bytes(),
+            ]
+        )
 
         return packet_bytes, frame["source"]
 
@@ -888,42 +917,29 @@ class PacketComm:
 
 def is_str_ipaddr(ipaddr: str) -> bool:
     """Check of a string is an IP address"""
-    if re.match(r"(\d+)\.(\d+)\.(\d+)\.(\d+)", ipaddr) is None:
-        return False
-
-    try:
-        ip_nums = map(int, ipaddr.split("."))
-        nums_valid = [0 <= n <= 255 for n in ip_nums]
-    except ValueError:
-        return False
-
-    return all(nums_valid)
+    # Octets are checked by hand because ipaddress rejects zero-padded octets like "001"
+    octets = ipaddr.split(".")
+    return len(octets) == 4 and all(octet.isdecimal() and int(octet) <= 255 for octet in octets)
 
 
 def is_str_mac(mac: str) -> bool:
     """Check if a string is a MAC address"""
-    if re.match(r"(\S\S):" * 5 + r"(\S\S)", mac) is None:
+    # Six octets with a separator after every octet
+    if len(mac) != 17 or mac[2::3] != ":::::":
         return False
-
     try:
-        mac_nums = [int("0x" + ch, 16) for ch in mac.split(":")]
-        nums_valid = [0 <= n <= 255 for n in mac_nums]
+        mac_bytes = bytes.fromhex(mac.replace(":", ""))
     except ValueError:
         return False
-
-    return all(nums_valid)
+    # fromhex skips whitespace, so a padded string can decode to fewer than six bytes
+    return len(mac_bytes) == 6
 
 
 def _mac_str_to_int(mac_str: str) -> int:
-    # Swap endianness, then convert to an integer
-    hex_str = "0x" + "".join(reversed(mac_str.split(":")))
-    return int(hex_str, 16)
+    # MAC addresses are stored little endian
+    return int.from_bytes(bytes.fromhex(mac_str.replace(":", "")), "little")
 
 
 def mac_str_to_int_list(mac_str: str) -> list[int]:
-    mac_int = _mac_str_to_int(mac_str)
-    int_list: list[int] = []
-    for _ in range(8):
-        int_list.append(mac_int % (1 << 8))
-        mac_int = mac_int >> 8
-    return int_list
+    # The frame address target is 8 bytes, little endian
+    return list(_mac_str_to_int(mac_str).to_bytes(8, "little"))
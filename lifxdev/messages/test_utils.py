@@ -43,14 +43,19 @@ class MockSocket:
     ):
         self._label = label
         self._mac_addr = mac_addr
+        self._product = product
+        self._wsock, self._rsock = socket.socketpair(type=socket.SOCK_DGRAM)
+        self._wsock.setblocking(False)
+        self._rsock.setblocking(False)
+        self.reset()
+
+    def reset(self) -> None:
+        """Restore every response to its default, as if the socket was just created"""
         self._response_bytes = b""
         self._last_addr = ("", 0)
         self._sequence = 0
         self._first_response_query = False
         self._responses: dict[str, bytes] = {}
-        self._wsock, self._rsock = socket.socketpair(type=socket.SOCK_DGRAM)
-        self._wsock.setblocking(False)
-        self._rsock.setblocking(False)
         for msg_num in sorted(packet._MESSAGE_TYPES.keys()):
             message = packet._MESSAGE_TYPES[msg_num]()
             name = message.name
@@ -73,7 +78,7 @@ class MockSocket:
                 message["port"] = packet.LIFX_PORT
             elif name == "StateVersion":
                 message["vendor"] = 1
-                message["product"] = product.value
+                message["product"] = self._product.value
 
             self._responses[name], self._source = packet.PacketComm.get_bytes_and_source(
                 payload=message,
@@ -47,6 +47,8 @@ class LifxClient:
 
         self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self._socket.settimeout(self._timeout)
+        # Commands are short, so send them without waiting on Nagle's algorithm.
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         self._socket.connect(self._addr)
 
     def close(self) -> None:
@@ -77,15 +79,23 @@ class LifxClient:
         """Send a command to the server and receive a response message"""
         self.connect()
         assert self._socket is not None
-        self._socket.send(cmd_and_args.encode())
+        self._socket.sendall(cmd_and_args.encode())
         recv_bytes = self._socket.recv(BUFFER_SIZE)
         if not recv_bytes:
             raise EOFError("EOF received from server.")
 
-        size, packet = recv_bytes.split(b":", maxsplit=1)
-        size = int(size)
-        while len(packet) < size:
-            packet += self._socket.recv(BUFFER_SIZE)
+        size, first_bytes = recv_bytes.split(b":", maxsplit=1)
+
+        # Receive the rest of the response in place instead of concatenating chunks
+        packet = bytearray(int(size))
+        view = memoryview(packet)
+        nbytes = len(first_bytes)
+        view[:nbytes] = first_bytes
+        while nbytes < len(packet):
+            nrecv = self._socket.recv_into(view[nbytes:])
+            if not nrecv:
+                raise EOFError("EOF received from server.")
+            nbytes += nrecv
         self.close()
         return pickle.loads(packet)
 
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import collections
+import functools
 import pathlib
 import subprocess as spr
 import sys
-import time
-
-import yaml
+import threading
+from typing import IO
 
+from lifxdev.config import loader
 
 CONFIG_PATH = pathlib.Path.home() / ".lifx" / "processes.yaml"
 
+# Only the tail of a process's output is kept, so a chatty process can't grow without bound.
+# Lines longer than the max length are split into multiple lines.
+_MAX_OUTPUT_LINES = 1024
+_MAX_LINE_LENGTH = 4096
+
 
 class DeviceConflictError(Exception):
     pass
@@ -60,6 +67,9 @@ class Process:
         self._cmd_args: list[str] | None = None
         self._proc: spr.Popen | None = None
         self._running = False
+        self._drainers: list[threading.Thread] = []
+        self._stdout_lines: collections.deque[str] = collections.deque()
+        self._stderr_lines: collections.deque[str] = collections.deque()
         self._devices = frozenset(devices)
         self._ongoing = ongoing
         self._immortal = immortal if ongoing else False
@@ -115,10 +125,9 @@ class Process:
             if self._proc.poll() is None:
                 # Do not reset self._proc to None so that check_failure can read it.
                 self._proc.kill()
-                # Wait until the process is fully killed before returning
-                # Not using self._proc.wait() since it can deadlock with pipes.
-                while self._proc.poll() is None:
-                    time.sleep(0.001)
+                # Block in waitpid until the process is fully killed before returning.
+                # This cannot deadlock on full pipes since SIGKILL cannot be caught.
+                self._proc.wait()
 
     def start(self, argv: list[str] = []) -> None:
         """Start the process"""
@@ -139,7 +148,38 @@ class Process:
 
         # Run the process.
         # Do not stop oneshot (non-ongoing processes). The ProcessManager handles that.
-        self._proc = spr.Popen(self._cmd_args, stdout=spr.PIPE, stderr=spr.PIPE, encoding="utf-8")
+        self._proc = spr.Popen(
+            self._cmd_args, stdout=spr.PIPE, stderr=spr.PIPE, encoding="utf-8", errors="replace"
+        )
+
+        # Read output continuously so a process can never block on a full pipe buffer.
+        # Oneshot processes are only collected once they exit, so they need this too.
+        self._stdout_lines = collections.deque(maxlen=_MAX_OUTPUT_LINES)
+        self._stderr_lines = collections.deque(maxlen=_MAX_OUTPUT_LINES)
+        self._drainers = [
+            threading.Thread(target=self._drain, args=(pipe, lines), daemon=True)
+            for pipe, lines in [
+                (self._proc.stdout, self._stdout_lines),
+                (self._proc.stderr, self._stderr_lines),
+            ]
+        ]
+        for drainer in self._drainers:
+            drainer.start()
+
+    @staticmethod
+    def _drain(pipe: IO[str], lines: collections.deque[str]) -> None:
+        """Read a pipe until EOF, keeping the most recent lines"""
+        with pipe:
+            lines.extend(iter(functools.partial(pipe.readline, _MAX_LINE_LENGTH), ""))
+
+    def _communicate(self) -> tuple[str, str]:
+        """Wait for the process to exit and return its stdout and stderr"""
+        assert self._proc
+        self._proc.wait()
+        for drainer in self._drainers:
+            drainer.join()
+        self._drainers = []
+        return "".join(self._stdout_lines), "".join(self._stderr_lines)
 
     def stop(self) -> None:
         """Stop the process"""
@@ -148,14 +188,14 @@ class Process:
 
         if self._proc.poll() is None:
             self._proc.kill()
-        self._proc.communicate()
+        self._communicate()
         self._proc = None
 
     def wait(self) -> spr.CompletedProcess:
         """Wait for the process to complete and return its output"""
         assert self._proc
         assert self._cmd_args
-        stdout, stderr = self._proc.communicate()
+        stdout, stderr = self._communicate()
         returncode = self._proc.returncode
         self._proc = None
         return spr.CompletedProcess(self._cmd_args, returncode, stdout.strip(), stderr.strip())
@@ -166,6 +206,8 @@ class ProcessManager:
 
     def __init__(self, config_path: str | pathlib.Path = CONFIG_PATH):
         self._all_processes: dict[str, Process] = {}
+        # The last process started on each device. Owners are checked for running on lookup.
+        self._device_owners: dict[str, Process] = {}
 
         self._config_path = pathlib.Path(config_path)
         if self._config_path.exists():
@@ -182,11 +224,10 @@ class ProcessManager:
         self.killall(kill_immortal=True)
 
         config_path = pathlib.Path(config_path or self._config_path)
-        with config_path.open() as f:
-            config_dict = yaml.safe_load(f)
+        config_dict = loader.load_yaml(config_path)
 
         # PROC_DIR is required.
-        proc_dir = config_dict.pop("PROC_DIR", None)
+        proc_dir = config_dict.get("PROC_DIR")
         if proc_dir:
             proc_dir = config_path.parent / pathlib.Path(proc_dir)
         else:
@@ -194,7 +235,13 @@ class ProcessManager:
 
         # Load Process objects for everything in the config
         self._all_processes: dict[str, Process] = {}
+        self._device_owners = {}
         for label, config in config_dict.items():
+            if label == "PROC_DIR":
+                continue
+
+            # Copy before popping so the cached config is left intact
+            config = dict(config)
             filename = config.pop("filename", None)
             if filename:
                 filename = proc_dir / filename
@@ -236,8 +283,7 @@ class ProcessManager:
         """
         available_processes: list[Process] = []
         running_processes: list[Process] = []
-        for label in self._all_processes:
-            process = self.get_process(label)
+        for process in self._all_processes.values():
             if process.running:
                 running_processes.append(process)
             else:
@@ -267,23 +313,25 @@ class ProcessManager:
         """
         process = self._all_processes[label]
 
-        # Get all devices for all running processes
-        all_devices = set()
-        for plabel, proc in self._all_processes.items():
-            if plabel == label:
-                continue
-
-            if not proc.running:
+        # Only the owners of this process's devices need to be polled for their running state.
+        in_use: set[str] = set()
+        for device in process.devices:
+            owner = self._device_owners.get(device)
+            if owner is None or owner is process:
                 continue
 
-            all_devices |= proc.devices
+            if owner.running:
+                in_use.add(device)
+            else:
+                del self._device_owners[device]
 
-        union = process.devices & all_devices
-        if union:
-            conflicts = ", ".join(union)
+        if in_use:
+            conflicts = ", ".join(in_use)
             raise DeviceConflictError(f"Devices in use: {conflicts}")
 
         process.start(argv)
+        for device in process.devices:
+            self._device_owners[device] = process
 
     def stop(self, label: str) -> None:
         """Stop the process"""
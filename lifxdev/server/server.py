@@ -175,6 +175,8 @@ class LifxServer:
         self._device_config_path = pathlib.Path(device_config_path)
         self._process_config_path = pathlib.Path(process_config_path)
         self._verbose = verbose
+        # Client and command logging level, chosen once instead of per connection
+        self._log_func = logging.info if verbose else logging.debug
 
         # TODO add args for configuring the device manager on init.
         self._device_manager = device_manager.DeviceManager(
@@ -182,6 +184,10 @@ class LifxServer:
             verbose=verbose,
             comm_init=comm_init,
         )
+        # Device and group listings, cached until the device config is reloaded
+        self._all_device_info: dict[str, dict[str, str]] | None = None
+        self._device_listing: str | None = None
+        self._group_listing: str | None = None
 
         self._process_manager = process.ProcessManager(self._process_config_path)
         # Since self._recv_and_run blocks until server commands have completed,
@@ -203,6 +209,11 @@ class LifxServer:
         for _, cmd in inspect.getmembers(self, predicate=_is_command):
             self._commands[cmd.label] = cmd
 
+        # Neither the commands nor the registered colormaps change, so format them once.
+        # The colormap listing waits for the first request so matplotlib is not loaded at startup.
+        self._help_message = self._format_help()
+        self._colormap_listing: str | None = None
+
     def close(self) -> None:
         self._socket.close()
 
@@ -222,22 +233,30 @@ class LifxServer:
             raise InvalidDeviceError(f"{label!r}")
 
     def clear_stale_connections(self, now_time: float) -> None:
-        conn_fds = frozenset(self._connections.keys())
-        for fd in conn_fds:
-            if now_time - self._connections[fd].init_time > MAX_TIME_IN_QUEUE:
-                self._connections.pop(fd)
+        stale_fds = [
+            fd
+            for fd, connection in self._connections.items()
+            if now_time - connection.init_time > MAX_TIME_IN_QUEUE
+        ]
+        for fd in stale_fds:
+            self._close_connection(self._connections[fd].conn)
+
+    def _close_connection(self, conn: socket.socket) -> None:
+        """Stop tracking a client connection and close it"""
+        self._connections.pop(conn.fileno(), None)
+        self._selector.unregister(conn)
+        conn.close()
 
     def recv_and_run(self, now_time: float) -> None:
         """Receive an incoming connection and run the command from it"""
-        log_func = logging.info if self._verbose else logging.debug
-
         if not (events := self._selector.select(POLL_TIMEOUT)):
             return
 
         for key, _ in events:
             if key.fd == self._socket.fileno():
                 conn, (ip, port) = self._socket.accept()
-                log_func(f"Received client at address: {ip}:{port}")
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self._log_func(f"Received client at address: {ip}:{port}")
                 self._connections[conn.fileno()] = _Connection(conn=conn, init_time=now_time)
                 self._selector.register(conn, selectors.EVENT_READ)
             elif key.fd in self._connections:
@@ -247,11 +266,11 @@ class LifxServer:
 
     def _recv_and_run(self, conn: socket.socket) -> None:
         """Receive a command over TCP, run it, and send back the result string."""
-        cmd_args = shlex.split(conn.recv(BUFFER_SIZE).decode().strip())
+        # shlex.split already drops surrounding whitespace and newlines
+        cmd_str = conn.recv(BUFFER_SIZE).decode()
+        cmd_args = shlex.split(cmd_str)
         if not cmd_args:
-            self._connections.pop(conn.fileno(), None)
-            self._selector.unregister(conn)
-            conn.close()
+            self._close_connection(conn)
             return
 
         cmd_label = cmd_args.pop(0)
@@ -265,10 +284,9 @@ class LifxServer:
             self._send_response(conn, ServerResponse(response=cmd.parser.format_help().strip()))
             return
 
-        # Run the command and send the result to the client
-        cmd_msg = " ".join([shlex.quote(word) for word in cmd_args])
-        log_func = logging.info if self._verbose else logging.debug
-        log_func(f"Running command: {cmd_label} {cmd_msg}")
+        # Run the command and send the result to the client.
+        # Log the command as received instead of re-quoting the parsed tokens.
+        self._log_func(f"Running command: {cmd_str.strip()}")
         try:
             kwargs = vars(cmd.parser.parse_args(cmd_args))
             response = ServerResponse(response=cmd(**kwargs))
@@ -284,12 +302,10 @@ class LifxServer:
         size = len(resp_bytes)
         resp_bytes = f"{size}:".encode() + resp_bytes
         conn.sendall(resp_bytes)
-        self._connections.pop(conn.fileno(), None)
-        self._selector.unregister(conn)
-        conn.close()
+        self._close_connection(conn)
 
-    @_command("help", "Show every server command and description.")
-    def _show_help(self) -> str:
+    def _format_help(self) -> str:
+        """Format the descriptions of every registered command"""
         ljust = 12
         indent = 8
         msg_lines = [
@@ -306,6 +322,10 @@ class LifxServer:
         msg_lines.append("")
         return "\n".join(msg_lines)
 
+    @_command("help", "Show every server command and description.")
+    def _show_help(self) -> str:
+        return self._help_message
+
     @_command("off", "Turn all lights off and stop all processes.")
     def _lights_off(self):
         self._process_manager.killall()
@@ -322,7 +342,7 @@ class LifxServer:
     def _reload_config(self, config: str | None) -> str:
         config_loaders = {
             "device": {
-                "method": self._device_manager.load_config,
+                "method": self._load_device_config,
                 "args": (self._device_config_path,),
             },
             "process": {
@@ -350,6 +370,13 @@ class LifxServer:
 
         return response
 
+    def _load_device_config(self, config_path: pathlib.Path) -> None:
+        """Reload the device config and invalidate the cached device listings"""
+        self._device_manager.load_config(config_path)
+        self._all_device_info = None
+        self._device_listing = None
+        self._group_listing = None
+
     @staticmethod
     def _get_device_info(device_list: list[light.LifxLight]) -> dict[str, dict[str, str]]:
         """Get attributes about a list of devices"""
@@ -399,12 +426,17 @@ class LifxServer:
             ]
 
         else:
-            device_dict = self._get_device_info(self._device_manager.get_all_devices().values())
+            if self._all_device_info is None:
+                all_devices = self._device_manager.get_all_devices().values()
+                self._all_device_info = self._get_device_info(all_devices)
             if to_json:
-                return json.dumps(device_dict)
+                return json.dumps(self._all_device_info)
 
-            msg_lines = ["\n\n    LIFX Devices:\n"]
-            msg_lines.append(self._format_device_attributes(device_dict))
+            if self._device_listing is None:
+                msg_lines = ["\n\n    LIFX Devices:\n"]
+                msg_lines.append(self._format_device_attributes(self._all_device_info))
+                self._device_listing = "\n".join(msg_lines)
+            return self._device_listing
 
         return "\n".join(msg_lines)
 
@@ -424,11 +456,14 @@ class LifxServer:
             if to_json:
                 return json.dumps({"groups": list(self._device_manager.get_all_groups().keys())})
 
-            msg_lines = ["\n\n    LIFX Groups:\n"]
-            for group in sorted(self._device_manager.get_all_groups().keys()):
-                msg_lines.append("".join([" " * 8, group]))
+            if self._group_listing is None:
+                msg_lines = ["\n\n    LIFX Groups:\n"]
+                for group in sorted(self._device_manager.get_all_groups().keys()):
+                    msg_lines.append("".join([" " * 8, group]))
 
-            msg_lines.append("")
+                msg_lines.append("")
+                self._group_listing = "\n".join(msg_lines)
+            return self._group_listing
         return "\n".join(msg_lines)
 
     @_command("color", "Get or set the color of a device or group.")
@@ -465,7 +500,7 @@ class LifxServer:
         lifx_device = self._get_device_or_group(label)
 
         assert lifx_device is not None
-        if any([hue is None, saturation is None, brightness is None]):
+        if None in (hue, saturation, brightness):
             if isinstance(lifx_device, device_manager.DeviceGroup):
                 raise UnknownServerCommand("Cannot get color state of a device group.")
             hsbk = lifx_device.get_color()
@@ -473,22 +508,21 @@ class LifxServer:
             hsbk = color.Hsbk.from_tuple((hue, saturation, brightness, kelvin))
             lifx_device.set_color(hsbk, duration=duration)
 
-        msg = ""
+        # Only format the color state when it is going to be returned
         if machine:
-            msg = ""
-        else:
-            hsbk_str = "\n".join(
-                [
-                    f"hue: {hsbk.hue}",
-                    f"saturation: {hsbk.saturation}",
-                    f"brightness: {hsbk.brightness}",
-                    f"kelvin: {hsbk.kelvin}",
-                ]
-            )
-            if lifx_device == self._device_manager.root:
-                label = "Global"
-            msg = f"{label} color state:\n{hsbk_str}"
-        return msg
+            return ""
+
+        hsbk_str = "\n".join(
+            [
+                f"hue: {hsbk.hue}",
+                f"saturation: {hsbk.saturation}",
+                f"brightness: {hsbk.brightness}",
+                f"kelvin: {hsbk.kelvin}",
+            ]
+        )
+        if lifx_device == self._device_manager.root:
+            label = "Global"
+        return f"{label} color state:\n{hsbk_str}"
 
     @_command("cmap", "Set a device or group to a matplotlib colormap.")
     @_add_arg("label", arg_type=str, nargs="?", help_msg="Device or group to set power to.")
@@ -518,14 +552,16 @@ class LifxServer:
 
         # Print colormaps and return
         if not colormap:
-            msg_lines = ["\n\n    Matplotlib Colormaps:\n"]
-            for cmap_name in color.get_all_colormaps():
-                if cmap_name.endswith("_r"):
-                    continue
-                msg_lines.append("".join([" " * 8, cmap_name]))
-
-            msg_lines.append("")
-            return "\n".join(msg_lines)
+            if self._colormap_listing is None:
+                msg_lines = ["\n\n    Matplotlib Colormaps:\n"]
+                for cmap_name in color.get_all_colormaps():
+                    if cmap_name.endswith("_r"):
+                        continue
+                    msg_lines.append("".join([" " * 8, cmap_name]))
+
+                msg_lines.append("")
+                self._colormap_listing = "\n".join(msg_lines)
+            return self._colormap_listing
 
         # Set the colormap
         lifx_device = self._get_device_or_group(label)
@@ -1,10 +1,7 @@
 #!/usr/bin/env python3
 
-import logging
 import unittest
 
-import coloredlogs
-
 from lifxdev.colors import color
 
 
@@ -33,6 +30,10 @@ class ColorTest(unittest.TestCase):
         self.assertEqual(hsbk_4[0], hsbk_8[0])
         self.assertEqual(hsbk_4[-1], hsbk_8[-1])
 
+        # Zone 49 of 64 sits right on the Set1 boundary between brown and pink (49 / 63)
+        set1 = color.get_colormap("Set1", 64, 5500)
+        self.assertEqual(set1[49], color.get_colormap("Set1", 9, 5500)[7])
+
     def test_max_brightnessg(self):
         hsbk = color.Hsbk.from_tuple((300, 1, 1, 5500)).max_brightness(0.5)
         self.assertAlmostEqual(hsbk.brightness, 0.5)
@@ -42,5 +43,8 @@ class ColorTest(unittest.TestCase):
 
 
 if __name__ == "__main__":
+    import coloredlogs
+    import logging
+
     coloredlogs.install(level=logging.INFO)
     unittest.main()
@@ -1,13 +1,11 @@
 #!/usr/bin/env python3
 
-import logging
 import pathlib
 import unittest
 from typing import cast
 
-import coloredlogs
-
 from lifxdev.colors import color
+from lifxdev.config import loader
 from lifxdev.devices import device_manager
 from lifxdev.devices import light
 from lifxdev.devices import multizone
@@ -17,16 +15,28 @@ from lifxdev.messages import test_utils
 
 CONFIG_PATH = pathlib.Path(__file__).parent / "test_data" / "devices.yaml"
 
+# The mock socket answers immediately, so only the wait for further responses uses this.
+_TIMEOUT = 0.01
+
+# Zone colors that reset a multizone device to plain white
+_WHITE16 = tuple(color.Hsbk(hue=0, saturation=0, brightness=1, kelvin=5500) for _ in range(16))
+
 
 class DeviceManagerTest(unittest.TestCase):
-    def setUp(self):
-        self.mock_socket = test_utils.MockSocket()
-        self.lifx = device_manager.DeviceManager(
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_socket = test_utils.MockSocket()
+        cls.lifx = device_manager.DeviceManager(
+            timeout=_TIMEOUT,
             verbose=True,
-            comm_init=lambda: self.mock_socket,
+            comm_init=lambda: cls.mock_socket,
             config_path=CONFIG_PATH,
         )
 
+    def setUp(self):
+        # Devices keep their state in the shared socket, so clear what the last test set
+        self.mock_socket.reset()
+
     def test_get_devices(self):
         response = self.lifx.get_devices_on_network()
         self.assertIsNotNone(response)
@@ -55,6 +65,16 @@ class DeviceManagerTest(unittest.TestCase):
         product_info = self.lifx.get_product_info("127.0.0.1")
         self.assertEqual(product_info["class"], tile.LifxTile)
 
+    def test_products_cached(self):
+        other = device_manager.DeviceManager(
+            comm_init=lambda: self.mock_socket, config_path=CONFIG_PATH
+        )
+        self.assertIs(self.lifx._products, other._products)
+
+        self.mock_socket.set_product(test_utils.Product.TILE)
+        self.lifx.get_product_info("127.0.0.1")
+        self.assertTrue(all("class" not in product for product in other._products.values()))
+
     def test_discovery(self):
         label = "LIFX UnitTest Bulb"
         self.mock_socket.set_label(label)
@@ -83,11 +103,21 @@ class DeviceManagerTest(unittest.TestCase):
 
         # Test bad configs
         for ii in range(1, 3 + 1):
-            self.assertRaises(
-                device_manager.DeviceConfigError,
-                self.lifx.load_config,
-                CONFIG_PATH.parent / f"bad_config{ii}.yaml",
-            )
+            with self.subTest(bad_config=ii):
+                self.assertRaises(
+                    device_manager.DeviceConfigError,
+                    self.lifx.load_config,
+                    CONFIG_PATH.parent / f"bad_config{ii}.yaml",
+                )
+
+    def test_reload_cached(self):
+        config_dict = loader.load_yaml(CONFIG_PATH)
+        device_a = self.lifx.get_device("device-a")
+
+        # Reloading an unchanged config reuses the parse but rebuilds the devices
+        self.lifx.load_config()
+        self.assertIs(loader.load_yaml(CONFIG_PATH), config_dict)
+        self.assertIsNot(self.lifx.get_device("device-a"), device_a)
 
     def test_set_color(self):
         hsbk = color.Hsbk(hue=300, saturation=1, brightness=1, kelvin=5500)
@@ -100,10 +130,9 @@ class DeviceManagerTest(unittest.TestCase):
             self.assertEqual(device_hsbk.kelvin, hsbk.kelvin)
 
     def test_set_colormap(self):
-        colors = [color.Hsbk.from_tuple((0, 0, 1, 5500)) for _ in range(16)]
         for device in self.lifx.get_all_devices().values():
             if isinstance(device, multizone.LifxMultiZone):
-                device.set_multizone(colors)
+                device.set_multizone(list(_WHITE16))
 
         self.lifx.root.set_colormap("hsv")
         for device in self.lifx.get_all_devices().values():
@@ -111,6 +140,12 @@ class DeviceManagerTest(unittest.TestCase):
                 hsbk = device.get_color()
                 self.assertGreaterEqual(hsbk.brightness, 0.975)
 
+        # Setting a colormap again doesn't change how the group's devices are partitioned
+        light_type = device_manager.DeviceType.light
+        num_lights = len(self.lifx.root._devices_by_type[light_type])
+        self.lifx.root.set_colormap("hsv")
+        self.assertEqual(len(self.lifx.root._devices_by_type[light_type]), num_lights)
+
     def test_set_power(self):
         self.lifx.root.set_power(True)
         for device in self.lifx.get_all_devices().values():
@@ -146,5 +181,8 @@ class DeviceManagerTest(unittest.TestCase):
 
 
 if __name__ == "__main__":
+    import coloredlogs
+    import logging
+
     coloredlogs.install(level=logging.INFO)
     unittest.main()
@@ -1,26 +1,31 @@
 #!/usr/bin/env python3
 
-import logging
 import unittest
 
-import coloredlogs
-
 from lifxdev.devices import device
 from lifxdev.messages import test_utils
 
 
 class DeviceTest(unittest.TestCase):
-    def setUp(self):
-        self.lifx = device.LifxDevice(
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_socket = test_utils.MockSocket()
+        cls.lifx = device.LifxDevice(
             "127.0.0.1",
-            comm_init=lambda: test_utils.MockSocket(),
+            comm_init=lambda: cls.mock_socket,
         )
 
+    def setUp(self):
+        self.mock_socket.reset()
+
     def test_set_power(self):
         self.assertIsNotNone(self.lifx.set_power(True, ack_required=True))
         self.assertTrue(self.lifx.get_power())
 
 
 if __name__ == "__main__":
+    import coloredlogs
+    import logging
+
     coloredlogs.install(level=logging.INFO)
     unittest.main()
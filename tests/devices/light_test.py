@@ -1,10 +1,7 @@
 #!/usr/bin/env python3
 
-import logging
 import unittest
 
-import coloredlogs
-
 from lifxdev.colors import color
 from lifxdev.devices import light
 from lifxdev.messages import packet
@@ -12,13 +9,18 @@ from lifxdev.messages import test_utils
 
 
 class LightTest(unittest.TestCase):
-    def setUp(self):
-        self.lifx = light.LifxInfraredLight(
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_socket = test_utils.MockSocket(product=test_utils.Product.LIGHT)
+        cls.lifx = light.LifxInfraredLight(
             "127.0.0.1",
             label="LIFX mock",
-            comm_init=lambda: test_utils.MockSocket(product=test_utils.Product.LIGHT),
+            comm_init=lambda: cls.mock_socket,
         )
 
+    def setUp(self):
+        self.mock_socket.reset()
+
     def test_set_color(self):
         hsbk = color.Hsbk(hue=300, saturation=1, brightness=1, kelvin=5500)
         self.assertIsNotNone(self.lifx.set_color(hsbk, ack_required=True))
@@ -39,5 +41,8 @@ class LightTest(unittest.TestCase):
 
 
 if __name__ == "__main__":
+    import coloredlogs
+    import logging
+
     coloredlogs.install(level=logging.INFO)
     unittest.main()
@@ -1,10 +1,7 @@
 #!/usr/bin/env python3
 
-import logging
 import unittest
 
-import coloredlogs
-
 from lifxdev.colors import color
 from lifxdev.devices import multizone
 from lifxdev.messages import packet
@@ -12,13 +9,18 @@ from lifxdev.messages import test_utils
 
 
 class MultiZoneTest(unittest.TestCase):
-    def setUp(self):
-        self.lifx = multizone.LifxMultiZone(
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_socket = test_utils.MockSocket(product=test_utils.Product.MZ)
+        cls.lifx = multizone.LifxMultiZone(
             "127.0.0.1",
             label="LIFX mock",
-            comm_init=lambda: test_utils.MockSocket(product=test_utils.Product.MZ),
+            comm_init=lambda: cls.mock_socket,
         )
 
+    def setUp(self):
+        self.mock_socket.reset()
+
     def test_set_multizone(self):
         colors = [
             color.Hsbk(hue=20 * ii, saturation=1, brightness=1, kelvin=5500) for ii in range(16)
@@ -38,7 +40,13 @@ class MultiZoneTest(unittest.TestCase):
             self.lifx.set_colormap("cool", ack_required=True), packet.LifxResponse
         )
 
+        # Colors that don't fit in the message are rejected before anything is sent
+        self.assertRaises(IndexError, self.lifx.set_multizone, colors, index=75)
+
 
 if __name__ == "__main__":
+    import coloredlogs
+    import logging
+
     coloredlogs.install(level=logging.INFO)
     unittest.main()
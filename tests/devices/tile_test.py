@@ -1,10 +1,7 @@
 #!/usr/bin/env python3
 
-import logging
 import unittest
 
-import coloredlogs
-
 from lifxdev.colors import color
 from lifxdev.devices import tile
 from lifxdev.messages import packet
@@ -12,13 +9,18 @@ from lifxdev.messages import test_utils
 
 
 class MultiZoneTest(unittest.TestCase):
-    def setUp(self):
-        self.lifx = tile.LifxTile(
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_socket = test_utils.MockSocket(product=test_utils.Product.TILE)
+        cls.lifx = tile.LifxTile(
             "127.0.0.1",
             label="LIFX mock",
-            comm_init=lambda: test_utils.MockSocket(product=test_utils.Product.TILE),
+            comm_init=lambda: cls.mock_socket,
         )
 
+    def setUp(self):
+        self.mock_socket.reset()
+
     def test_get_device_chain(self):
         response = self.lifx.get_chain().payload
         self.assertEqual(response["total_count"], 5)
@@ -47,7 +49,19 @@ class MultiZoneTest(unittest.TestCase):
             self.lifx.set_colormap("cool", ack_required=True), packet.LifxResponse
         )
 
+    def test_square_indices(self):
+        self.assertEqual(tile._get_square_indices(1), (0,) * tile.TILE_WIDTH**2)
+
+        # Quadrants of the 8x8 tile when divided in two
+        indices = tile._get_square_indices(2)
+        self.assertEqual(indices[:8], (0, 0, 0, 0, 1, 1, 1, 1))
+        self.assertEqual(indices[-8:], (2, 2, 2, 2, 3, 3, 3, 3))
+        self.assertEqual(sorted(set(tile._get_square_indices(4))), list(range(16)))
+
 
 if __name__ == "__main__":
+    import coloredlogs
+    import logging
+
     coloredlogs.install(level=logging.INFO)
     unittest.main()
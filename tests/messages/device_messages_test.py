@@ -3,8 +3,6 @@
 import logging
 import unittest
 
-import coloredlogs
-
 from lifxdev.messages import device_messages
 
 
@@ -49,5 +47,7 @@ class DeviceMessageTest(unittest.TestCase):
 
 
 if __name__ == "__main__":
+    import coloredlogs
+
     coloredlogs.install(level=logging.INFO)
     unittest.main()
@@ -3,8 +3,6 @@
 import logging
 import unittest
 
-import coloredlogs
-
 from lifxdev.messages import packet
 from lifxdev.messages import light_messages
 
@@ -107,5 +105,7 @@ class LightMessageTest(unittest.TestCase):
 
 
 if __name__ == "__main__":
+    import coloredlogs
+
     coloredlogs.install(level=logging.INFO)
     unittest.main()
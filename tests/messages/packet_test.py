@@ -1,12 +1,9 @@
 #!/usr/bin/env python3
 
-import logging
 import socket
 import unittest
 from typing import cast
 
-import coloredlogs
-
 from lifxdev.messages import packet
 from lifxdev.messages import light_messages
 from lifxdev.messages import test_utils
@@ -18,10 +15,22 @@ class PacketTest(unittest.TestCase):
         self.assertFalse(packet.is_str_ipaddr("123.456.789.0"))
         self.assertFalse(packet.is_str_ipaddr("AAAAAAAAAAAAAAA"))
         self.assertFalse(packet.is_str_ipaddr("1.2.3."))
+        self.assertFalse(packet.is_str_ipaddr("1.2.3.4.5"))
+        self.assertFalse(packet.is_str_ipaddr("1.2.3.-4"))
+        # Zero-padded octets are still valid addresses
+        self.assertTrue(packet.is_str_ipaddr("192.168.001.010"))
 
         self.assertTrue(packet.is_str_mac("ff:ff:ff:ff:ff:ff"))
         self.assertFalse(packet.is_str_mac("aaaaaaaaaaaaaaaaaaaa"))
         self.assertFalse(packet.is_str_mac("ab:cd:ef:gh:ij:kl"))
+        self.assertFalse(packet.is_str_mac("ff:ff:ff:ff:ff:ff:ff"))
+        self.assertFalse(packet.is_str_mac("  :ff:ff:ff:ff:ff"))
+
+        self.assertEqual(
+            packet.mac_str_to_int_list("01:23:45:67:89:ab"),
+            [0x01, 0x23, 0x45, 0x67, 0x89, 0xAB, 0, 0],
+        )
+        self.assertEqual(packet._mac_str_to_int("01:23:45:67:89:ab"), 0xAB8967452301)
 
     def test_hsbk(self):
         hsbk = packet.Hsbk()
@@ -33,6 +42,8 @@ class PacketTest(unittest.TestCase):
         hsbk_bytes = hsbk.to_bytes()
         bytes_ints = [int(b) for b in hsbk_bytes]
         self.assertEqual(bytes_ints, [0, 0, 255, 255, 255, 255, 124, 21])
+        # The precompiled struct packs the same bytes as the generic register walk
+        self.assertEqual(hsbk_bytes, packet.LifxStruct.to_bytes(hsbk))
 
         hsbk_from_bytes = packet.Hsbk.from_bytes(hsbk_bytes)
         self.assertEqual(hsbk_from_bytes["hue"], hsbk["hue"])
@@ -194,5 +205,8 @@ class PacketTest(unittest.TestCase):
 
 
 if __name__ == "__main__":
+    import coloredlogs
+    import logging
+
     coloredlogs.install(level=logging.INFO)
     unittest.main()
@@ -3,8 +3,6 @@
 import logging
 import unittest
 
-import coloredlogs
-
 from lifxdev.messages import tile_messages
 from lifxdev.messages import firmware_effects
 
@@ -26,5 +24,7 @@ class MultiZoneMessageTest(unittest.TestCase):
 
 
 if __name__ == "__main__":
+    import coloredlogs
+
     coloredlogs.install(level=logging.INFO)
     unittest.main()
@@ -4,6 +4,7 @@ import pathlib
 import time
 import unittest
 
+from lifxdev.config import loader
 from lifxdev.server import logs
 from lifxdev.server import process
 
@@ -72,6 +73,30 @@ class ProcessTest(unittest.TestCase):
         self.assertRaises(process.DeviceConflictError, self.process_manager.start, label2)
         self.process_manager.stop(label1)
 
+        # Devices are free once their owner is stopped
+        self.process_manager.start(label2)
+        self.assertRaises(process.DeviceConflictError, self.process_manager.start, label1)
+        self.process_manager.stop(label2)
+
+    def test_output_tail(self):
+        chatty = process.Process("chatty", PROCESS_CONFIG.parent / "chatty.py")
+        chatty.start()
+        stdout_lines = chatty.wait().stdout.splitlines()
+        self.assertEqual(len(stdout_lines), process._MAX_OUTPUT_LINES)
+        self.assertEqual(stdout_lines[-1], "line 4999")
+
+    def test_reload_cached(self):
+        config_dict = loader.load_yaml(PROCESS_CONFIG)
+        labels = sorted(p.label for p in self.process_manager.get_available_and_running()[0])
+
+        # Reloading an unchanged config reuses the parsed YAML and leaves it intact
+        self.process_manager.load_config()
+        self.assertIs(loader.load_yaml(PROCESS_CONFIG), config_dict)
+        self.assertIn("PROC_DIR", config_dict)
+        self.assertIn("filename", config_dict["ongoing"])
+        reloaded = sorted(p.label for p in self.process_manager.get_available_and_running()[0])
+        self.assertEqual(reloaded, labels)
+
 
 if __name__ == "__main__":
     logs.setup()
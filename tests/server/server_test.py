@@ -3,6 +3,7 @@
 import json
 import logging
 import pathlib
+import socket
 import unittest
 import threading
 import time
@@ -63,6 +64,17 @@ class ServerTest(unittest.TestCase):
             server.join()
         return response
 
+    def test_stale_connection(self):
+        with socket.create_connection(("127.0.0.1", self.port), timeout=5) as stale_conn:
+            now_time = time.monotonic()
+            while not self.lifx_server._connections:
+                self.lifx_server.recv_and_run(now_time)
+
+            # Stale connections are closed, not just forgotten
+            self.lifx_server.clear_stale_connections(now_time + server.MAX_TIME_IN_QUEUE + 1)
+            self.assertFalse(self.lifx_server._connections)
+            self.assertEqual(stale_conn.recv(1), b"")
+
     def test_bad_command(self):
         self.assertRaises(
             server.UnknownServerCommand,
@@ -0,0 +1,4 @@
+#!/usr/bin/env python3
+
+for ii in range(5000):
+    print(f"line {ii}")